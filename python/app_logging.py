@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -13,9 +16,14 @@ if TYPE_CHECKING:
 
 from settings import get_settings
 
-# Module-level logger
-_logger: logging.Logger | None = None
+# Module-level logger, bound once so log helpers skip any lookup.
+# setup_logging() configures this same instance in place.
+_logger: logging.Logger = logging.getLogger("komm_fmt")
+if not _logger.handlers:
+    _logger.addHandler(logging.NullHandler())
 _log_file_path: Path | None = None
+# Background thread that writes queued records to the log file
+_listener: logging.handlers.QueueListener | None = None
 
 
 def setup_logging(station: "Station", output_dir: Path | None = None) -> logging.Logger:
@@ -28,16 +36,20 @@ def setup_logging(station: "Station", output_dir: Path | None = None) -> logging
     Returns:
         Configured logger instance
     """
-    global _logger, _log_file_path
+    global _log_file_path, _listener
 
     settings = get_settings()
 
-    # Create logger
-    logger = logging.getLogger("komm_fmt")
-    logger.setLevel(logging.DEBUG)  # Capture all, filter at handler level
+    logger = _logger
+    # Logger level tracks the most verbose handler so isEnabledFor() guards
+    # in the log helpers reflect what will actually be written
+    logger.setLevel(logging.WARNING)
 
-    # Remove existing handlers
+    # Remove existing handlers and stop any previous listener
     logger.handlers.clear()
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
     # Console handler (only warnings and errors)
     console_handler = logging.StreamHandler(sys.stderr)
@@ -71,20 +83,30 @@ def setup_logging(station: "Station", output_dir: Path | None = None) -> logging
         file_handler = logging.FileHandler(log_path, encoding="utf-8")
         level = getattr(logging, settings.logging.level, logging.INFO)
         file_handler.setLevel(level)
+        logger.setLevel(min(level, logging.WARNING))
 
         file_format = logging.Formatter(
             "%(asctime)s | %(levelname)-8s | %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
 
-        # Log session start
+        # Console output stays synchronous so it interleaves with prompts.
+        # The message is still formatted in the calling thread (by
+        # QueueHandler.prepare); only the file writes move to the listener.
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _listener = logging.handlers.QueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        _listener.start()
+
+    # Log session start
+    if settings.logging.enabled:
         logger.info("=" * 60)
-        logger.info(f"Processing session started for station: {station.name}")
+        logger.info("Processing session started for station: %s", station.name)
         logger.info("=" * 60)
 
-    _logger = logger
     return logger
 
 
@@ -92,14 +114,8 @@ def get_logger() -> logging.Logger:
     """Get the application logger.
 
     Returns:
-        The configured logger, or a default logger if not set up.
+        The configured logger, or one with only a NullHandler if not set up.
     """
-    global _logger
-    if _logger is None:
-        # Return a basic logger if not set up
-        _logger = logging.getLogger("komm_fmt")
-        if not _logger.handlers:
-            _logger.addHandler(logging.NullHandler())
     return _logger
 
 
@@ -112,72 +128,84 @@ def get_log_file_path() -> Path | None:
     return _log_file_path
 
 
+def _stop_listener() -> None:
+    """Flush queued records and stop the listener thread at exit."""
+    if _listener is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
+
+
+# Message templates; logging fills in the arguments only if a record is emitted
+_FMT_FILE_READ = "Read file: %s (%s, %d lines)"
+_FMT_REJECTION = "Rejected line %d: %s - %s"
+_FMT_STOPWORD = "Line %d matched stopword: %s"
+_FMT_OVERFLOW = "Line %d: Fixed overflow time %s -> %s"
+_FMT_USER_CHOICE = "User choice (%s): %s -> %s"
+_FMT_DUPLICATE = "Duplicate at line %d: '%s' by '%s' on %s (first seen at line %d)"
+_FMT_ERROR = "%s: %s"
+_FMT_BACKUP = "Backup created: %s -> %s"
+
+
 def log_file_read(file_path: Path, encoding: str, line_count: int) -> None:
     """Log a file read operation."""
-    logger = get_logger()
-    logger.info(f"Read file: {file_path.name} ({encoding}, {line_count} lines)")
+    _logger.info(_FMT_FILE_READ, file_path.name, encoding, line_count)
 
 
 def log_rejection(line_num: int, reason: str, content_preview: str) -> None:
     """Log a line rejection."""
-    logger = get_logger()
+    if not _logger.isEnabledFor(logging.DEBUG):
+        return
     preview = content_preview[:50] + "..." if len(content_preview) > 50 else content_preview
-    logger.debug(f"Rejected line {line_num}: {reason} - {preview}")
+    _logger.debug(_FMT_REJECTION, line_num, reason, preview)
 
 
 def log_stopword_match(line_num: int, stopword: str) -> None:
     """Log a stopword match."""
-    logger = get_logger()
-    logger.debug(f"Line {line_num} matched stopword: {stopword}")
+    if not _logger.isEnabledFor(logging.DEBUG):
+        return
+    _logger.debug(_FMT_STOPWORD, line_num, stopword)
 
 
 def log_overflow_fix(line_num: int, original: str, fixed: str) -> None:
     """Log a playing time overflow fix."""
-    logger = get_logger()
-    logger.info(f"Line {line_num}: Fixed overflow time {original} -> {fixed}")
+    _logger.info(_FMT_OVERFLOW, line_num, original, fixed)
 
 
 def log_user_choice(choice_type: str, description: str, action: str) -> None:
     """Log a user choice."""
-    logger = get_logger()
-    logger.info(f"User choice ({choice_type}): {description} -> {action}")
+    _logger.info(_FMT_USER_CHOICE, choice_type, description, action)
 
 
 def log_duplicate_found(
     line_num: int, title: str, artist: str, date: str, first_line: int
 ) -> None:
     """Log a duplicate track found."""
-    logger = get_logger()
-    logger.info(
-        f"Duplicate at line {line_num}: '{title}' by '{artist}' on {date} "
-        f"(first seen at line {first_line})"
-    )
+    _logger.info(_FMT_DUPLICATE, line_num, title, artist, date, first_line)
 
 
 def log_processing_complete(
     files: int, lines_processed: int, lines_rejected: int, duration: float
 ) -> None:
     """Log processing completion."""
-    logger = get_logger()
-    logger.info("-" * 60)
-    logger.info(f"Processing complete:")
-    logger.info(f"  Files processed: {files}")
-    logger.info(f"  Lines processed: {lines_processed}")
-    logger.info(f"  Lines rejected: {lines_rejected}")
-    logger.info(f"  Duration: {duration:.2f}s")
-    logger.info("=" * 60)
+    _logger.info("-" * 60)
+    _logger.info("Processing complete:")
+    _logger.info("  Files processed: %d", files)
+    _logger.info("  Lines processed: %d", lines_processed)
+    _logger.info("  Lines rejected: %d", lines_rejected)
+    _logger.info("  Duration: %.2fs", duration)
+    _logger.info("=" * 60)
 
 
 def log_error(message: str, exc: Exception | None = None) -> None:
     """Log an error."""
-    logger = get_logger()
     if exc:
-        logger.error(f"{message}: {exc}", exc_info=True)
+        _logger.error(_FMT_ERROR, message, exc, exc_info=True)
     else:
-        logger.error(message)
+        _logger.error("%s", message)
 
 
 def log_backup_created(source: Path, dest: Path) -> None:
     """Log a backup creation."""
-    logger = get_logger()
-    logger.info(f"Backup created: {source.name} -> {dest}")
+    _logger.info(_FMT_BACKUP, source.name, dest)
@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import atexit
+import sys
 import tomllib
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
+from typing import Iterator, Literal
 
 from settings import get_settings
 
 # Choice types
 ChoiceAction = Literal["fix", "skip", "reject"]
 
+# Number of remembered choices to buffer before rewriting the choices file
+SAVE_BATCH_SIZE = 50
+
 
 class ChoicesManager:
     """Manages remembered user choices for artist/title fixes."""
@@ -30,12 +35,15 @@ class ChoicesManager:
         self.choices_file = config_dir / Path(settings.choices.choices_file).name
         self.enabled = settings.choices.remember_fixes
         self._choices: dict[str, dict] = {}
+        self._pending = 0  # Choices remembered since the last save
         self._load()
+        atexit.register(self.flush)
 
     def _load(self) -> None:
         """Load choices from file."""
         if not self.choices_file.exists():
             self._choices = {"artist_title_fixes": {}, "long_playing_times": {}}
+            self._bind_sections()
             return
 
         try:
@@ -44,51 +52,70 @@ class ChoicesManager:
         except Exception:
             self._choices = {"artist_title_fixes": {}, "long_playing_times": {}}
 
+        self._bind_sections()
+
+    def _bind_sections(self) -> None:
+        """Bind the choice sections so lookups skip the outer dict."""
+        self._artist_fixes = self._choices.setdefault("artist_title_fixes", {})
+        self._long_times = self._choices.setdefault("long_playing_times", {})
+
     def _save(self) -> None:
         """Save choices to file."""
         if not self.enabled:
             return
 
+        self._pending = 0
+
         # Ensure directory exists
         self.choices_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write TOML manually (tomllib is read-only)
-        lines = [
-            "# Remembered user choices",
-            f"# Last updated: {datetime.now().isoformat()}",
-            "",
-            "[artist_title_fixes]",
-        ]
+        try:
+            with open(self.choices_file, "w", encoding="utf-8") as f:
+                f.writelines(line + "\n" for line in self._toml_lines())
+        except Exception:
+            pass  # Silently fail if we can't save
+
+    def _toml_lines(self) -> Iterator[str]:
+        """Yield the choices file contents line by line (tomllib is read-only)."""
+        yield "# Remembered user choices"
+        yield f"# Last updated: {datetime.now().isoformat()}"
+        yield ""
+        yield "[artist_title_fixes]"
 
-        for key, data in self._choices.get("artist_title_fixes", {}).items():
+        for key, data in self._artist_fixes.items():
             # Escape the key for TOML
             safe_key = key.replace("\\", "\\\\").replace('"', '\\"')
             # Handle both string values (from TOML) and dict values (from code)
             action = data if isinstance(data, str) else data.get("action", "skip")
-            lines.append(f'"{safe_key}" = "{action}"')
+            yield f'"{safe_key}" = "{action}"'
 
-        lines.append("")
-        lines.append("[long_playing_times]")
+        yield ""
+        yield "[long_playing_times]"
 
-        for key, data in self._choices.get("long_playing_times", {}).items():
+        for key, data in self._long_times.items():
             safe_key = key.replace("\\", "\\\\").replace('"', '\\"')
             # Handle both string values (from TOML) and dict values (from code)
             if isinstance(data, str):
-                lines.append(f'"{safe_key}" = "{data}"')
+                yield f'"{safe_key}" = "{data}"'
             elif data.get("action") == "edit":
-                lines.append(f'"{safe_key}" = {{ action = "edit", time = "{data.get("time", "00:00")}" }}')
+                yield f'"{safe_key}" = {{ action = "edit", time = "{data.get("time", "00:00")}" }}'
             else:
-                lines.append(f'"{safe_key}" = "{data.get("action", "accept")}"')
+                yield f'"{safe_key}" = "{data.get("action", "accept")}"'
 
-        try:
-            with open(self.choices_file, "w", encoding="utf-8") as f:
-                f.write("\n".join(lines) + "\n")
-        except Exception:
-            pass  # Silently fail if we can't save
+    def _mark_changed(self) -> None:
+        """Record a new choice, saving once enough choices have accumulated."""
+        self._pending += 1
+        if self._pending >= SAVE_BATCH_SIZE:
+            self._save()
+
+    def flush(self) -> None:
+        """Write any unsaved choices to file."""
+        if self._pending:
+            self._save()
 
     def _make_key(self, title: str, artist: str) -> str:
         """Create a unique key for a title/artist combination."""
-        return f"{title}|||{artist}"
+        return sys.intern(f"{title}|||{artist}")
 
     def get_artist_title_choice(
         self, title: str, artist: str
@@ -106,7 +133,7 @@ class ChoicesManager:
             return None
 
         key = self._make_key(title, artist)
-        data = self._choices.get("artist_title_fixes", {}).get(key)
+        data = self._artist_fixes.get(key)
 
         if data is None:
             return None
@@ -129,11 +156,12 @@ class ChoicesManager:
             return
 
         key = self._make_key(title, artist)
-        if "artist_title_fixes" not in self._choices:
-            self._choices["artist_title_fixes"] = {}
+        entry = {"action": action}
+        if self._artist_fixes.get(key) in (entry, action):
+            return  # Already stored; nothing to write
 
-        self._choices["artist_title_fixes"][key] = {"action": action}
-        self._save()
+        self._artist_fixes[key] = entry
+        self._mark_changed()
 
     def get_playing_time_choice(
         self, title: str, artist: str, time: str
@@ -152,7 +180,7 @@ class ChoicesManager:
             return None, None
 
         key = self._make_key(title, artist)
-        data = self._choices.get("long_playing_times", {}).get(key)
+        data = self._long_times.get(key)
 
         if data is None:
             return None, None
@@ -185,22 +213,21 @@ class ChoicesManager:
             return
 
         key = self._make_key(title, artist)
-        if "long_playing_times" not in self._choices:
-            self._choices["long_playing_times"] = {}
-
         if action == "edit" and edited_time:
-            self._choices["long_playing_times"][key] = {
-                "action": action,
-                "time": edited_time,
-            }
+            entry = {"action": action, "time": edited_time}
         else:
-            self._choices["long_playing_times"][key] = {"action": action}
+            entry = {"action": action}
 
-        self._save()
+        if self._long_times.get(key) in (entry, action):
+            return  # Already stored; nothing to write
+
+        self._long_times[key] = entry
+        self._mark_changed()
 
     def clear_all(self) -> None:
         """Clear all remembered choices."""
         self._choices = {"artist_title_fixes": {}, "long_playing_times": {}}
+        self._bind_sections()
         self._save()
 
 
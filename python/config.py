@@ -1,5 +1,6 @@
 """Global configuration constants for commercial formatter."""
 
+import os
 from pathlib import Path
 
 # Paths
@@ -8,6 +9,7 @@ LIB_DIR = BASE_DIR / "lib"
 CONFIG_DIR = BASE_DIR / "config"
 CONVERT_SCRIPT = LIB_DIR / "convert.py"
 DELETE_COLS_SCRIPT = LIB_DIR / "delete_columns.py"
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "komm_fmt"
 REJECTDIR = Path("C:/Users/eva/Gramex/Rapporteringer - Documents/Afviste_linjer_kom_land")
 
 # Defaults
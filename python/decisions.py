@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Callable
+from itertools import chain
+from typing import Any, Callable, Iterable
 
 import app_logging as logging
 import output as console
@@ -36,32 +37,44 @@ class DecisionConfig:
     name: str  # "artist_title", "long_time", "duplicate"
     options: list[Option]
     prompt_prefix: str = "  "
+    # Pre-built in __post_init__; options don't change after construction
+    _prompt_text: str = field(default="", init=False, repr=False)
+    keys_hint: str = field(default="", init=False, repr=False)  # e.g. "Y, N, X"
+    _lookup: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _default_action: str | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        """Build the prompt text, valid-keys hint and response lookup once."""
+        for opt in self.options:
+            # First option wins when keys or aliases overlap
+            self._lookup.setdefault(opt.key, opt.action)
+            for alias in opt.aliases:
+                self._lookup.setdefault(alias, opt.action)
+            if opt.is_default and self._default_action is None:
+                self._default_action = opt.action
 
-    def get_prompt_text(self) -> str:
-        """Generate prompt text from options."""
         parts = []
         for opt in self.options:
             label = f"[{opt.key.upper()}]{opt.label[1:]}" if opt.label else f"[{opt.key.upper()}]"
             parts.append(label)
-        return self.prompt_prefix + " / ".join(parts) + ": "
+        self._prompt_text = self.prompt_prefix + " / ".join(parts) + ": "
+        self.keys_hint = ", ".join(o.key.upper() for o in self.options)
+
+    def get_prompt_text(self) -> str:
+        """Return prompt text generated from options."""
+        return self._prompt_text
 
     def parse_response(self, response: str) -> str | None:
-        """Parse user response to action name."""
-        response = response.strip().lower()
+        """Parse user response to action name.
 
-        # Check for default (empty input)
+        The response must already be stripped and lowercased; both prompt
+        loops do that as they read input.
+        """
+        # Empty input selects the default option, if any
         if not response:
-            for opt in self.options:
-                if opt.is_default:
-                    return opt.action
-            return None
-
-        # Check each option
-        for opt in self.options:
-            if response == opt.key or response in opt.aliases:
-                return opt.action
+            return self._default_action
 
-        return None
+        return self._lookup.get(response)
 
 
 class DecisionManager:
@@ -115,7 +128,8 @@ class DecisionManager:
             console.warning(summary_message)
             print()
 
-        reject_indices: set[int] = set()
+        # Collected per issue and merged once, instead of growing a set per issue
+        reject_chunks: list[Iterable[int]] = []
 
         for key, indices in issues.items():
             count = len(indices)
@@ -126,7 +140,7 @@ class DecisionManager:
                 if remembered:
                     action, extra_data = self._parse_remembered(remembered)
                     self._log_remembered(action, key, count)
-                    reject_indices.update(apply_action(action, key, indices, extra_data))
+                    reject_chunks.append(apply_action(action, key, indices, extra_data))
                     continue
 
             # Display issue
@@ -144,15 +158,15 @@ class DecisionManager:
 
             # Apply action
             if action:
-                reject_indices.update(apply_action(action, key, indices, extra_data))
+                reject_chunks.append(apply_action(action, key, indices, extra_data))
 
             print()
 
-        return reject_indices
+        return set(chain.from_iterable(reject_chunks))
 
     def _parse_remembered(self, remembered: Any) -> tuple[str, Any]:
         """Parse remembered choice into (action, extra_data)."""
-        if isinstance(remembered, tuple):
+        if type(remembered) is tuple:
             return remembered[0], remembered[1] if len(remembered) > 1 else None
         return remembered, None
 
@@ -165,7 +179,7 @@ class DecisionManager:
             action = self.config.parse_response(response)
 
             if action is None:
-                console.error(f"  Invalid choice. Enter one of: {', '.join(o.key.upper() for o in self.config.options)}")
+                console.error(f"  Invalid choice. Enter one of: {self.config.keys_hint}")
                 continue
 
             # Handle actions that need extra input
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
 import app_logging as logging
 from settings import get_settings
 
@@ -9,6 +12,93 @@ from settings import get_settings
 SECONDS_PER_DAY = 86400
 MINUTES_PER_DAY = 1440
 
+# Broadcast logs repeat the same dates and times on many lines
+FORMAT_CACHE_SIZE = 4096
+
+
+def _from_yymmdd(date_str: str) -> str:
+    """Convert YYMMDD to DD-MM-YYYY."""
+    yy = date_str[0:2]
+    year = f"20{yy}" if int(yy) < 50 else f"19{yy}"
+    return f"{date_str[4:6]}-{date_str[2:4]}-{year}"
+
+
+def _from_ddmmyyyy(date_str: str) -> str:
+    """Convert DDMMYYYY to DD-MM-YYYY."""
+    return f"{date_str[0:2]}-{date_str[2:4]}-{date_str[4:8]}"
+
+
+def _from_iso(date_str: str) -> str:
+    """Convert YYYY-MM-DD to DD-MM-YYYY."""
+    return f"{date_str[8:10]}-{date_str[5:7]}-{date_str[0:4]}"
+
+
+def _from_dotted(date_str: str) -> str:
+    """Convert DD.MM.YYYY to DD-MM-YYYY."""
+    return date_str.replace(".", "-")
+
+
+# Classifies a date in one scan; the matching group names its converter.
+# Anything else (including DD-MM-YYYY) is returned as-is.
+_DATE_RE = re.compile(
+    r"(?P<yymmdd>\d{6})"
+    r"|(?P<ddmmyyyy>\d{8})"
+    r"|(?P<iso>[^-]{4}-[^-]{2}-[^-]{2})"
+    r"|(?P<dotted>..\...\.....)",
+    re.DOTALL,
+)
+
+_DATE_HANDLERS = {
+    "yymmdd": _from_yymmdd,
+    "ddmmyyyy": _from_ddmmyyyy,
+    "iso": _from_iso,
+    "dotted": _from_dotted,
+}
+
+
+@lru_cache(maxsize=FORMAT_CACHE_SIZE)
+def _correct_overflow(duration_str: str, overflow_threshold: int) -> str | None:
+    """Compute the midnight-overflow correction for a playing time.
+
+    Args:
+        duration_str: Duration string in MM:SS or HH:MM:SS format.
+        overflow_threshold: Minutes at or above which the time has overflowed.
+
+    Returns:
+        Corrected MM:SS string, or None if the duration needs no correction.
+    """
+    # Fast path for canonical MM:SS, avoiding the split() list
+    try:
+        if len(duration_str) < 4 or duration_str[-3] != ":":
+            raise ValueError
+        minutes = int(duration_str[:-3])
+        seconds = int(duration_str[-2:])
+    except ValueError:
+        if ":" not in duration_str:
+            return None
+
+        parts = duration_str.split(":")
+        try:
+            minutes = int(parts[0])
+            seconds = int(parts[1])
+        except ValueError:
+            return None
+
+    if minutes < overflow_threshold:
+        return None
+
+    # Convert to total seconds and correct for day overflow
+    total_seconds = minutes * 60 + seconds
+    correct_seconds = SECONDS_PER_DAY - total_seconds
+
+    if correct_seconds < 0:
+        return None
+
+    # Convert back to MM:SS
+    correct_minutes = correct_seconds // 60
+    correct_secs = correct_seconds % 60
+    return f"{correct_minutes:02d}:{correct_secs:02d}"
+
 
 class FieldFormatter:
     """Formats and normalizes field values for broadcast metadata."""
@@ -18,19 +108,15 @@ class FieldFormatter:
 
         Args:
             overflow_threshold: Minutes threshold for overflow detection.
-                               If None, loads from settings on first use.
+                               If None, loads from settings.
         """
-        self._overflow_threshold = overflow_threshold
-
-    @property
-    def overflow_threshold(self) -> int:
-        """Get overflow threshold, loading from settings if needed."""
-        if self._overflow_threshold is None:
-            settings = get_settings()
-            self._overflow_threshold = settings.thresholds.overflow_threshold_minutes
-        return self._overflow_threshold
+        if overflow_threshold is None:
+            overflow_threshold = get_settings().thresholds.overflow_threshold_minutes
+        # Plain attribute: read per row by format_duration
+        self.overflow_threshold: int = overflow_threshold
 
     @staticmethod
+    @lru_cache(maxsize=FORMAT_CACHE_SIZE)
     def format_date(date_str: str) -> str:
         """Normalize date to DD-MM-YYYY format.
 
@@ -48,37 +134,14 @@ class FieldFormatter:
             Normalized date string in DD-MM-YYYY format.
         """
         date_str = date_str.strip()
-
-        # Handle 6-digit format: YYMMDD
-        if len(date_str) == 6 and date_str.isdigit():
-            yy = date_str[0:2]
-            mm = date_str[2:4]
-            dd = date_str[4:6]
-            year = f"20{yy}" if int(yy) < 50 else f"19{yy}"
-            return f"{dd}-{mm}-{year}"
-
-        # Handle 8-digit format: DDMMYYYY
-        if len(date_str) == 8 and date_str.isdigit():
-            dd = date_str[0:2]
-            mm = date_str[2:4]
-            yyyy = date_str[4:8]
-            return f"{dd}-{mm}-{yyyy}"
-
-        # Handle YYYY-MM-DD format (convert to DD-MM-YYYY)
-        if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
-            parts = date_str.split("-")
-            if len(parts) == 3 and len(parts[0]) == 4:
-                yyyy, mm, dd = parts
-                return f"{dd}-{mm}-{yyyy}"
-
-        # Handle DD.MM.YYYY format (convert to DD-MM-YYYY)
-        if len(date_str) == 10 and date_str[2] == "." and date_str[5] == ".":
-            return date_str.replace(".", "-")
-
-        # Already DD-MM-YYYY or unknown format, return as-is
-        return date_str
+        match = _DATE_RE.fullmatch(date_str)
+        if match is None:
+            # Already DD-MM-YYYY or unknown format, return as-is
+            return date_str
+        return _DATE_HANDLERS[match.lastgroup](date_str)
 
     @staticmethod
+    @lru_cache(maxsize=FORMAT_CACHE_SIZE)
     def format_time(time_str: str) -> str:
         """Format a 6-digit time string (HHMMSS) to HH:MM:SS.
 
@@ -104,34 +167,13 @@ class FieldFormatter:
         Returns:
             Corrected duration string.
         """
-        if ":" not in duration_str:
-            return duration_str
-
-        parts = duration_str.split(":")
-        if len(parts) < 2:
+        corrected = _correct_overflow(duration_str, self.overflow_threshold)
+        if corrected is None:
             return duration_str
 
-        try:
-            minutes = int(parts[0])
-            seconds = int(parts[1])
-        except ValueError:
-            return duration_str
-
-        if minutes < self.overflow_threshold:
-            return duration_str
-
-        # Convert to total seconds and correct for day overflow
-        total_seconds = minutes * 60 + seconds
-        correct_seconds = SECONDS_PER_DAY - total_seconds
-
-        if correct_seconds < 0:
-            return duration_str
-
-        # Convert back to MM:SS
-        correct_minutes = correct_seconds // 60
-        correct_secs = correct_seconds % 60
-        corrected = f"{correct_minutes:02d}:{correct_secs:02d}"
-
+        # Logged on every call that fixes a value, hence outside the lru_cache.
+        # process_files formats each distinct line once, so an exact repeat
+        # of a line is logged only the first time it is seen.
         logging.log_overflow_fix(0, duration_str, corrected)
 
         return corrected
@@ -3,8 +3,10 @@ import sys
 import os
 import csv
 import shutil
+from datetime import date, datetime, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from openpyxl import load_workbook
+from python_calamine import CalamineWorkbook
 
 # Simple ANSI colors
 USE_COLORS = hasattr(sys.stdout, "isatty") and sys.stdout.isatty() and not os.environ.get("NO_COLOR")
@@ -15,23 +17,54 @@ RED = "\033[91m" if USE_COLORS else ""
 RESET = "\033[0m" if USE_COLORS else ""
 
 
+def _cell_value(value):
+    """Normalize a calamine cell value for CSV output.
+
+    XLSX stores all numbers as floats; whole numbers are written as ints
+    so "5" does not turn into "5.0". Past 2**53 floats are not exact
+    integers, so those keep their float form ("1e+20"). Calamine returns a
+    bare date for date cells without a time; it is written as a midnight
+    datetime, the "2025-01-02 00:00:00" form format_date has always received.
+    """
+    if isinstance(value, float) and value.is_integer() and abs(value) <= 2**53:
+        return int(value)
+    if type(value) is date:
+        return datetime.combine(value, time())
+    return value
+
+
 def convert_xlsx_to_csv(xlsx_path):
     """Convert an XLSX file to CSV format."""
-    # Load workbook with data_only=True to get evaluated cell values
-    wb = load_workbook(xlsx_path, data_only=True)
-    sheet = wb.active
-
     csv_path = os.path.splitext(xlsx_path)[0] + ".csv"
 
-    with open(csv_path, "w", newline="", encoding="utf-8") as csv_file:
-        writer = csv.writer(csv_file, delimiter=";")
-        for row in sheet.iter_rows(values_only=True):
-            writer.writerow(row)
+    # Calamine parses the sheet natively and yields evaluated cell values.
+    # The workbook is closed right away so the original can be moved to bak/.
+    with CalamineWorkbook.from_path(xlsx_path) as wb:
+        sheet = wb.get_sheet_by_index(0)
+        # iter_rows starts at the first non-empty column; empty leading
+        # columns are put back so fields keep their positions from column A
+        lead = [""] * (sheet.start[1] if sheet.start else 0)
+
+        with open(csv_path, "w", newline="", encoding="utf-8", buffering=1 << 20) as csv_file:
+            writer = csv.writer(csv_file, delimiter=";")
+            writer.writerows(
+                lead + [_cell_value(value) for value in row] for row in sheet.iter_rows()
+            )
 
     xlsx_name = Path(xlsx_path).name
     csv_name = Path(csv_path).name
     print(f"  {GREEN}✓{RESET} {xlsx_name} → {CYAN}{csv_name}{RESET}")
 
+def _move_to_backup(file_path):
+    """Move a converted original into the bak/ folder next to it."""
+    file_dir = os.path.dirname(file_path) or "."
+    bak_folder = os.path.join(file_dir, "bak")
+    os.makedirs(bak_folder, exist_ok=True)
+
+    dest_path = os.path.join(bak_folder, os.path.basename(file_path))
+    shutil.move(file_path, dest_path)
+    print(f"    {DIM}(moved original to bak/){RESET}")
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python convert.py file1.xlsx file2.xlsx ...")
@@ -40,23 +73,37 @@ def main():
     files = sys.argv[1:]
     print(f"{DIM}Converting {len(files)} XLSX file(s)...{RESET}")
 
+    paths = []
     for file_path in files:
         if os.path.isfile(file_path):
-            try:
-                convert_xlsx_to_csv(file_path)
+            paths.append(file_path)
+        else:
+            print(f"  {RED}✗{RESET} File not found: {file_path}")
+
+    if not paths:
+        return
 
-                # Move original to backup folder
-                file_dir = os.path.dirname(file_path) or "."
-                bak_folder = os.path.join(file_dir, "bak")
-                os.makedirs(bak_folder, exist_ok=True)
+    # A single workbook is converted here; starting worker processes would cost more
+    if len(paths) == 1:
+        file_path = paths[0]
+        try:
+            convert_xlsx_to_csv(file_path)
+            _move_to_backup(file_path)
+        except Exception as e:
+            print(f"  {RED}✗{RESET} Error converting '{file_path}': {e}")
+        return
 
-                dest_path = os.path.join(bak_folder, os.path.basename(file_path))
-                shutil.move(file_path, dest_path)
-                print(f"    {DIM}(moved original to bak/){RESET}")
+    # Each workbook is parsed independently and CPU-bound, so spread across processes
+    max_workers = min(len(paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(convert_xlsx_to_csv, p): p for p in paths}
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                future.result()
+                _move_to_backup(file_path)
             except Exception as e:
-                print(f"  {RED}✗{RESET} Error: {e}")
-        else:
-            print(f"  {RED}✗{RESET} File not found: {file_path}")
+                print(f"  {RED}✗{RESET} Error converting '{file_path}': {e}")
 
 if __name__ == "__main__":
     main()
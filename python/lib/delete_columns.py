@@ -1,8 +1,12 @@
 #!/usr/bin/env python3
 import sys
+import codecs
 import csv
+import io
 import os
-import chardet
+import shutil
+import tempfile
+from operator import itemgetter
 
 from utils import get_file_path_from_args, validate_csv_file
 
@@ -15,69 +19,238 @@ GREEN = "\033[92m" if USE_COLORS else ""
 RESET = "\033[0m" if USE_COLORS else ""
 
 
+# I/O buffer size for reading and rewriting the CSV
+IO_BUFFER_SIZE = 1 << 20
+
+# Encoding detection only looks at this many leading bytes
+ENCODING_SAMPLE_SIZE = 256 * 1024
+# Station files are utf-8 or Windows-1252; unrestricted detection tends to pick
+# cp1250 for Danish text
+CANDIDATE_ENCODINGS = ['utf_8', 'cp1252']
+# Encodings identified by a byte order mark, checked before detection.
+# UTF-32 first: its little-endian mark starts with the UTF-16 one.
+BOM_ENCODINGS = [
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+
 def detect_encoding(file_path):
-    """Detect the encoding of the file using chardet."""
+    """Detect the encoding of the file using charset-normalizer on a leading sample."""
+    # Deferred import keeps script start-up light
+    from charset_normalizer import from_bytes
+
     with open(file_path, 'rb') as f:
-        raw_data = f.read()
-    result = chardet.detect(raw_data)
-    encoding = result.get('encoding', 'utf-8')
+        raw_data = f.read(ENCODING_SAMPLE_SIZE)
+    # A byte order mark names the encoding; isolated detection would miss UTF-16
+    for bom, encoding in BOM_ENCODINGS:
+        if raw_data.startswith(bom):
+            return encoding
+    # Cut a truncated sample at the last full line so a split multi-byte
+    # character does not skew detection
+    if len(raw_data) == ENCODING_SAMPLE_SIZE:
+        last_newline = raw_data.rfind(b'\n')
+        if last_newline > 0:
+            raw_data = raw_data[:last_newline + 1]
+    best = from_bytes(raw_data, cp_isolation=CANDIDATE_ENCODINGS).best()
+    encoding = best.encoding if best else 'utf-8'
+    # A pure-ASCII sample says nothing about the rest of the file; utf-8 is a superset
+    if encoding.lower() == 'ascii':
+        encoding = 'utf-8'
     return encoding
 
-def remove_delete_columns_and_empty_rows(file_path):
-    """Remove columns named 'DELETE' and drop rows where 'Main Artist' or 'Track Title' is empty."""
-    detected_encoding = detect_encoding(file_path)
+def _make_projection(indices):
+    """Build a callable returning the values at `indices` of a row as a list."""
+    if not indices:
+        return lambda row: []
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda row: [row[index]]
+    getter = itemgetter(*indices)
+    return lambda row: list(getter(row))
 
-    with open(file_path, 'r', newline='', encoding=detected_encoding, errors='replace') as infile:
-        reader = csv.reader(infile, delimiter=';')
-        rows = list(reader)
+def _is_rewrite_identical(infile, header_len, drop_reason):
+    """Check whether rewriting infile would reproduce it byte for byte.
 
-    if not rows:
-        print(f"{YELLOW}Warning:{RESET} No data found in {os.path.basename(file_path)}")
-        sys.stdout.flush()
-        return
+    Every row must be kept (drop_reason returns None) at full length, and
+    csv.writer must give back each row's exact source text, terminators and
+    quoting included.
+    """
+    consumed = []
 
-    original_header = rows[0]
-    delete_columns = [i for i, column in enumerate(original_header) if column == "DELETE"]
+    def source_lines():
+        for line in infile:
+            consumed.append(line)
+            yield line
 
-    cleaned_rows = []
-    for row in rows:
-        # Handle short rows safely
-        padded_row = row + [""] * (len(original_header) - len(row))
-        cleaned_row = [value for i, value in enumerate(padded_row) if i not in delete_columns]
-        cleaned_rows.append(cleaned_row)
+    rewritten = io.StringIO()
+    writer = csv.writer(rewritten, delimiter=';')
+    for index, row in enumerate(csv.reader(source_lines(), delimiter=';')):
+        if index and (len(row) < header_len or drop_reason(row) is not None):
+            return False
+        rewritten.seek(0)
+        rewritten.truncate()
+        writer.writerow(row)
+        if rewritten.getvalue() != "".join(consumed):
+            return False
+        consumed.clear()
+    # Trailing text the reader never turned into a row
+    return not consumed
 
-    cleaned_header = cleaned_rows[0]
-    try:
-        main_artist_idx = cleaned_header.index("Main Artist")
-    except ValueError:
-        main_artist_idx = None
+def _rewrite_without_delete_columns(file_path, tmp_path, encoding, errors, skip_unchanged=False):
+    """Stream file_path into tmp_path without DELETE columns or empty rows.
 
-    try:
-        track_title_idx = cleaned_header.index("Track Title")
-    except ValueError:
-        track_title_idx = None
+    With skip_unchanged, a file that rewriting would reproduce byte for byte
+    is only read, and tmp_path is left untouched.
 
-    final_rows = [cleaned_header]
+    Returns:
+        Tuple of (columns removed, empty rows removed, malformed rows removed,
+        whether tmp_path was written), or None if the file has no header row.
+    """
     deleted_empty = 0
     deleted_malformed = 0
 
-    for row in cleaned_rows[1:]:
-        # Skip short rows
-        if len(row) <= max(main_artist_idx or 0, track_title_idx or 0):
-            deleted_malformed += 1
-            continue
+    with open(file_path, 'r', newline='', encoding=encoding, errors=errors,
+              buffering=IO_BUFFER_SIZE) as infile:
+        reader = csv.reader(infile, delimiter=';')
+
+        original_header = next(reader, None)
+        if original_header is None:
+            return None
+
+        header_len = len(original_header)
+        keep_columns = [i for i, column in enumerate(original_header) if column != "DELETE"]
+        delete_count = header_len - len(keep_columns)
+
+        project = _make_projection(keep_columns)
+        padding = [""] * header_len
+        cleaned_header = project(original_header)
+
+        try:
+            main_artist_idx = cleaned_header.index("Main Artist")
+        except ValueError:
+            main_artist_idx = None
+
+        try:
+            track_title_idx = cleaned_header.index("Track Title")
+        except ValueError:
+            track_title_idx = None
+
+        min_len = max(main_artist_idx or 0, track_title_idx or 0)
+
+        # Map the checked columns back to the raw row so rows can be filtered
+        # before projection; dropped rows are never copied.
+        check_empty = main_artist_idx is not None and track_title_idx is not None
+        artist_src = title_src = None
+        if check_empty:
+            artist_src = keep_columns[main_artist_idx]
+            title_src = keep_columns[track_title_idx]
+
+        def drop_reason(row):
+            """Return why a data row is dropped ("malformed" or "empty"), or None."""
+            row_len = len(row)
 
-        if main_artist_idx is not None and track_title_idx is not None:
-            artist_val = row[main_artist_idx].strip()
-            title_val = row[track_title_idx].strip()
-            if artist_val == "" or title_val == "":
-                deleted_empty += 1
-                continue
-        final_rows.append(row)
+            # Skip short rows
+            if max(row_len, header_len) - delete_count <= min_len:
+                return "malformed"
+
+            # Fields past the end of a short row count as empty
+            if check_empty and (
+                artist_src >= row_len or title_src >= row_len
+                or row[artist_src].strip() == "" or row[title_src].strip() == ""
+            ):
+                return "empty"
+            return None
+
+        if skip_unchanged and not delete_count:
+            # Short rows (padded or malformed), empty artist/title rows and
+            # anything csv.writer would re-terminate or re-quote change the file
+            infile.seek(0)
+            if _is_rewrite_identical(infile, header_len, drop_reason):
+                return 0, 0, 0, False
+            infile.seek(0)
+            reader = csv.reader(infile, delimiter=';')
+            next(reader)
+
+        def kept_rows():
+            """Yield cleaned rows to keep, counting the ones dropped."""
+            nonlocal deleted_empty, deleted_malformed
+            for row in reader:
+                reason = drop_reason(row)
+                if reason == "malformed":
+                    deleted_malformed += 1
+                    continue
+                if reason == "empty":
+                    deleted_empty += 1
+                    continue
+
+                row_len = len(row)
+
+                if row_len < header_len:
+                    # Pad short rows so the C-level projection handles them too;
+                    # no per-cell index test
+                    row.extend(padding[:header_len - row_len])
+
+                if not delete_count:
+                    # No columns to drop; write the row as read
+                    yield row
+                    continue
+
+                cleaned_row = project(row)
+                if row_len > header_len:
+                    cleaned_row.extend(row[header_len:])
+                yield cleaned_row
+
+        with open(tmp_path, 'w', newline='', encoding='utf-8', buffering=IO_BUFFER_SIZE) as outfile:
+            writer = csv.writer(outfile, delimiter=';')
+            writer.writerow(cleaned_header)
+            # writerows drives the generator from C, one call for the whole file
+            writer.writerows(kept_rows())
+
+    return delete_count, deleted_empty, deleted_malformed, True
+
+
+def remove_delete_columns_and_empty_rows(file_path):
+    """Remove columns named 'DELETE' and drop rows where 'Main Artist' or 'Track Title' is empty."""
+    # Unique temp file next to the original so os.replace stays a same-filesystem rename
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f"{os.path.basename(file_path)}.", suffix=".tmp",
+        dir=os.path.dirname(file_path) or ".",
+    )
+    os.close(fd)
+
+    try:
+        # Files written by this tool are utf-8, so only run detection if that fails
+        try:
+            result = _rewrite_without_delete_columns(file_path, tmp_path, 'utf-8', 'strict',
+                                                     skip_unchanged=True)
+        except UnicodeDecodeError:
+            detected_encoding = detect_encoding(file_path)
+            result = _rewrite_without_delete_columns(file_path, tmp_path, detected_encoding, 'replace')
+    except BaseException:
+        # Never leave a partial temp file behind; the original is untouched
+        os.remove(tmp_path)
+        raise
+
+    if result is None:
+        os.remove(tmp_path)
+        print(f"{YELLOW}Warning:{RESET} No data found in {os.path.basename(file_path)}")
+        sys.stdout.flush()
+        return
+
+    delete_count, deleted_empty, deleted_malformed, rewritten = result
+    if not rewritten:
+        os.remove(tmp_path)
+        print(f"{GREEN}Done:{RESET} nothing to remove → {CYAN}{os.path.basename(file_path)}{RESET}")
+        sys.stdout.flush()
+        return
 
-    with open(file_path, 'w', newline='', encoding='utf-8') as outfile:
-        writer = csv.writer(outfile, delimiter=';')
-        writer.writerows(final_rows)
+    # mkstemp creates the file owner-only; keep the original's permissions
+    shutil.copymode(file_path, tmp_path)
+    os.replace(tmp_path, file_path)
 
     # Print summary
     total_deleted = deleted_empty + deleted_malformed
@@ -89,7 +262,7 @@ def remove_delete_columns_and_empty_rows(file_path):
             parts.append(f"{deleted_malformed} malformed")
         print(f"{YELLOW}Cleanup:{RESET} Removed {total_deleted} row(s) ({', '.join(parts)})")
 
-    print(f"{GREEN}Done:{RESET} {len(delete_columns)} columns removed → {CYAN}{os.path.basename(file_path)}{RESET}")
+    print(f"{GREEN}Done:{RESET} {delete_count} columns removed → {CYAN}{os.path.basename(file_path)}{RESET}")
     sys.stdout.flush()
 
 def main():
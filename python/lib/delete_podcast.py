@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
+import csv
+import os
+import shutil
 import sys
-import pandas as pd
+import tempfile
 
 from utils import get_file_path_from_args, validate_csv_file
 
@@ -11,15 +14,42 @@ def delete_podcast_only_rows(file_path):
     The check is done case-insensitively on the string representation of the value.
     The file is edited in place.
     """
-    # Read the CSV file using semicolon as the delimiter
-    df = pd.read_csv(file_path, delimiter=';', encoding='utf-8')
-    
-    if "Podcast only" in df.columns:
-        # Remove rows where "Podcast only" equals "TRUE" (case-insensitive)
-        df = df[~(df["Podcast only"].astype(str).str.upper() == "TRUE")]
-    
-    # Write the processed data back to the same file, preserving the semicolon delimiter
-    df.to_csv(file_path, index=False, sep=';', encoding='utf-8')
+    # Unique temp file next to the original so os.replace stays a same-filesystem rename
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f"{os.path.basename(file_path)}.", suffix=".tmp",
+        dir=os.path.dirname(file_path) or ".",
+    )
+
+    try:
+        # Stream rows through to the temp file using semicolon as the delimiter
+        # The temp file is opened first so its descriptor is always closed
+        with open(fd, 'w', newline='', encoding='utf-8') as outfile, \
+                open(file_path, 'r', newline='', encoding='utf-8') as infile:
+            reader = csv.reader(infile, delimiter=';')
+            writer = csv.writer(outfile, delimiter=';')
+
+            header = next(reader, None)
+            if header is not None:
+                writer.writerow(header)
+                try:
+                    podcast_idx = header.index("Podcast only")
+                except ValueError:
+                    writer.writerows(reader)
+                else:
+                    # Remove rows where "Podcast only" equals "TRUE" (case-insensitive)
+                    writer.writerows(
+                        row for row in reader
+                        if podcast_idx >= len(row) or row[podcast_idx].strip().upper() != "TRUE"
+                    )
+    except BaseException:
+        # Never leave a partial temp file behind; the original is untouched
+        os.remove(tmp_path)
+        raise
+
+    # mkstemp creates the file owner-only; keep the original's permissions
+    shutil.copymode(file_path, tmp_path)
+    # Replace the original in place
+    os.replace(tmp_path, file_path)
     print(f"Rows with 'Podcast only' == TRUE have been removed. File updated: {file_path}")
 
 def main():
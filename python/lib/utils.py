@@ -1,17 +1,18 @@
 #!/usr/bin/env python3
 """Shared utilities for lib scripts."""
 
+import importlib.util
 import os
-import subprocess
 import sys
 from pathlib import Path
 
 
 def get_file_path_from_args() -> str:
-    """Get file path from command line arguments, handling spaces in filenames."""
-    if len(sys.argv) < 2:
-        return ""
-    return " ".join(sys.argv[1:]).strip()
+    """Get file path from the first command line argument.
+
+    Callers pass the path as a single argument, so spaces need no special handling.
+    """
+    return sys.argv[1] if len(sys.argv) >= 2 else ""
 
 
 def validate_csv_file(file_path: str) -> bool:
@@ -28,20 +29,54 @@ def validate_csv_file(file_path: str) -> bool:
     return True
 
 
+# Scripts loaded by run_python_script, by path; each is imported only once
+_loaded_scripts = {}
+
+
+def _load_script(script_path: Path):
+    """Import a script as a module, or return it if already imported."""
+    module = _loaded_scripts.get(script_path)
+    if module is None:
+        # Scripts import their siblings (e.g. utils) by bare name
+        script_dir = str(script_path.parent)
+        added_path = script_dir not in sys.path
+        if added_path:
+            sys.path.insert(0, script_dir)
+        try:
+            spec = importlib.util.spec_from_file_location(script_path.stem, script_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        finally:
+            if added_path:
+                sys.path.remove(script_dir)
+        _loaded_scripts[script_path] = module
+    return module
+
+
 def run_python_script(script_path: Path, *args: str) -> bool:
-    """Run a Python script with error handling.
+    """Run a Python script's main() in this interpreter with error handling.
+
+    Loading the script as a module avoids starting a new interpreter and
+    re-importing its dependencies for every call.
 
     Returns True if successful, False otherwise.
     """
+    if not script_path.is_file():
+        print(f"Warning: Could not find {script_path}")
+        return False
+
+    saved_argv = sys.argv
+    sys.argv = [str(script_path), *args]
     try:
-        subprocess.run(
-            [sys.executable, str(script_path)] + list(args),
-            check=True
-        )
+        _load_script(script_path).main()
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"Warning: {script_path.name} failed: {e}")
+    except SystemExit as e:
+        if e.code in (None, 0):
+            return True
+        print(f"Warning: {script_path.name} failed: exit status {e.code}")
         return False
-    except FileNotFoundError:
-        print(f"Warning: Could not find {script_path}")
+    except Exception as e:
+        print(f"Warning: {script_path.name} failed: {e}")
         return False
+    finally:
+        sys.argv = saved_argv
@@ -1,33 +1,83 @@
 #!/usr/bin/env python3
 """Commercial Formatter - Main entry point."""
 
-import argparse
+from __future__ import annotations
+
+import os
+import pickle
+import re
+import stat
 import subprocess
 import sys
-import tomllib
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
 import output as console
-from config import CONVERT_SCRIPT, NOTVALIDSTATION, REJECTDIR
-from processor import get_files, make_additional_filename, process_files, read_files
-from stations import get_station, list_aliases, list_stations
+from config import CACHE_DIR, CONVERT_SCRIPT, NOTVALIDSTATION, REJECTDIR
+
+if TYPE_CHECKING:
+    import argparse
+
+# processor (and chardet behind it) and stations are imported where they are
+# used, so --help, --edit-choices and --reject-path start without them
 
 # Folder mapping config
 FOLDERS_CONFIG = Path(__file__).parent / "config" / "folders.toml"
+FOLDERS_CACHE = CACHE_DIR / "folders.pkl"
+FOLDERS_CACHE_FORMAT = 2  # Bump when the cached mapping's shape changes
+
+# Matches xls/xlsx files case-insensitively without lowercasing each name
+_XLS_RE = re.compile("xls", re.IGNORECASE)
+
+
+def load_folder_mapping() -> list[tuple[str, str]]:
+    """Load folder to station mapping from config.
+
+    Folder names are lowercased once here, in config order. The result is
+    pickled to FOLDERS_CACHE, keyed by the config's path, mtime and size,
+    so unchanged configs skip the TOML parse.
+
+    Returns:
+        List of (lowercased folder name, station alias) pairs.
+    """
+    try:
+        st = FOLDERS_CONFIG.stat()
+    except FileNotFoundError:
+        return []
+    key = (FOLDERS_CACHE_FORMAT, str(FOLDERS_CONFIG), st.st_mtime_ns, st.st_size)
 
+    try:
+        with open(FOLDERS_CACHE, "rb") as f:
+            cached_key, mapping = pickle.load(f)
+        if cached_key == key:
+            return mapping
+    except Exception:
+        pass  # Missing or unreadable cache; parse the TOML
 
-def load_folder_mapping() -> dict[str, str]:
-    """Load folder to station mapping from config."""
-    if not FOLDERS_CONFIG.exists():
-        return {}
+    # Only needed on a cache miss
+    import tomllib
 
     with open(FOLDERS_CONFIG, "rb") as f:
         data = tomllib.load(f)
+    mapping = [
+        (folder_name.lower(), station_alias)
+        for folder_name, station_alias in data.get("folders", {}).items()
+    ]
+
+    try:
+        FOLDERS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = FOLDERS_CACHE.with_name(f"{FOLDERS_CACHE.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump((key, mapping), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, FOLDERS_CACHE)
+    except OSError:
+        pass  # Caching is best-effort
 
-    return data.get("folders", {})
+    return mapping
 
 
-def detect_station_from_path() -> str | None:
+def detect_station_from_path(cwd: Path) -> str | None:
     """Detect station alias from current working directory path.
 
     Checks if any configured folder name appears in the current path.
@@ -36,21 +86,23 @@ def detect_station_from_path() -> str | None:
     if not folder_mapping:
         return None
 
-    cwd_str = str(Path.cwd()).lower()
+    cwd_str = str(cwd).lower()
 
-    for folder_name, station_alias in folder_mapping.items():
+    for folder_name, station_alias in folder_mapping:
         # Check if folder name appears in the path (case-insensitive)
-        if folder_name.lower() in cwd_str:
+        if folder_name in cwd_str:
             return station_alias
 
     return None
 
 
-def run_convert_script():
-    """Run the XLSX to CSV conversion script."""
+def run_convert_script(cwd: Path):
+    """Run the XLSX to CSV conversion script on xls files in `cwd`."""
     # Find xlsx files manually since Windows doesn't expand globs
     # Use case-insensitive matching
-    xlsx_files = [f for f in Path.cwd().iterdir() if f.is_file() and "xls" in f.name.lower()]
+    # scandir's entries carry the file type, so is_file() needs no extra stat
+    with os.scandir(cwd) as entries:
+        xlsx_files = [e.path for e in entries if _XLS_RE.search(e.name) and e.is_file()]
     if not xlsx_files:
         console.warning("No xlsx files found to convert")
         return
@@ -58,9 +110,9 @@ def run_convert_script():
     console.info(f"Converting {len(xlsx_files)} xlsx file(s)...")
     try:
         subprocess.run(
-            [sys.executable, str(CONVERT_SCRIPT)] + [str(f) for f in xlsx_files],
+            [sys.executable, str(CONVERT_SCRIPT)] + xlsx_files,
             check=True,
-            cwd=Path.cwd()
+            cwd=cwd
         )
     except subprocess.CalledProcessError as e:
         console.warning(f"convert.py failed: {e}")
@@ -68,12 +120,11 @@ def run_convert_script():
         console.warning(f"Could not find {CONVERT_SCRIPT}")
 
 
-def suggest_output_filename() -> str:
+def suggest_output_filename(cwd: Path) -> str:
     """Suggest output filename based on folder structure.
 
     Expects structure like: /Silkeborg/2025/q4/ -> 2025_q4_silkeborg.csv
     """
-    cwd = Path.cwd()
     quarter = cwd.name.lower()           # e.g., "q4"
     year = cwd.parent.name               # e.g., "2025"
     station_folder = cwd.parent.parent.name.lower()  # e.g., "silkeborg"
@@ -93,8 +144,16 @@ def check_file_accessible(file_path: Path) -> bool:
     Returns:
         True if file is accessible or doesn't exist, False if locked
     """
-    if not file_path.exists():
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
         return True
+    except OSError:
+        return False
+
+    if sys.platform != "win32":
+        # No mandatory share locks on POSIX; write permission is the whole answer
+        return not stat.S_ISDIR(st.st_mode) and os.access(file_path, os.W_OK)
 
     try:
         # Try to open the file in append mode to check if it's locked
@@ -124,19 +183,39 @@ def ensure_file_accessible(file_path: Path) -> bool:
 
 def print_stations_and_aliases():
     """Print all stations and their aliases."""
+    from stations import list_aliases, list_stations
+
     aliases = list_aliases()
-    print("Available stations and aliases:")
-    print("-" * 40)
+    out = ["Available stations and aliases:", "-" * 40]
     for station_key in list_stations():
         station_aliases = aliases.get(station_key, [])
         if station_aliases:
-            print(f"  {station_key}: {', '.join(station_aliases)}")
+            out.append(f"  {station_key}: {', '.join(station_aliases)}")
         else:
-            print(f"  {station_key}")
-    print()
-
+            out.append(f"  {station_key}")
+    out.append("")
+    # One write for the whole listing
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+# Long options of the fast-path parser, mapped to their args attribute
+_FLAG_OPTIONS = {
+    "--no-stopwords": "no_stopwords",
+    "--list-stations": "list_stations",
+    "--edit-choices": "edit_choices",
+    "--reject-path": "reject_path",
+    "--no-reject-file": "no_reject_file",
+}
+_VALUE_OPTIONS = {
+    "--additional": "additional",
+    "--additional-postfix": "additional_postfix",
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the full argparse parser, used for help and unusual command lines."""
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(
         prog="komm_fmt",
         description="Commercial Formatter — Process broadcast metadata files",
@@ -203,7 +282,78 @@ Examples:
         help="Skip saving rejected lines to the rejection log file",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def fast_parse(argv: list[str]) -> SimpleNamespace | None:
+    """Parse the common command-line shapes without argparse.
+
+    Handles the station positional, the bare flags, --additional[=X],
+    --additional-postfix[=X] and -f/--file. Returns None for anything else
+    (help, unknown or abbreviated options, missing values, extra positionals)
+    so the caller can fall back to argparse and its error messages.
+
+    Args:
+        argv: Command-line arguments without the program name.
+
+    Returns:
+        Namespace matching build_parser().parse_args(), or None.
+    """
+    args = SimpleNamespace(
+        station=None,
+        additional="",
+        additional_postfix="_additional",
+        no_stopwords=False,
+        list_stations=False,
+        edit_choices=False,
+        files=None,
+        reject_path=False,
+        no_reject_file=False,
+    )
+
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+
+        if not arg.startswith("-") or arg == "-":
+            if arg == "-" or args.station is not None:
+                return None
+            args.station = arg
+            continue
+
+        if arg in _FLAG_OPTIONS:
+            setattr(args, _FLAG_OPTIONS[arg], True)
+            continue
+
+        name, has_value, value = arg.partition("=")
+        if name in _VALUE_OPTIONS or name in ("-f", "--file"):
+            if not has_value:
+                if i >= len(argv) or argv[i].startswith("-"):
+                    return None
+                value = argv[i]
+                i += 1
+            elif name == "-f":
+                return None
+        elif arg.startswith("-f") and not arg.startswith("--") and not has_value:
+            name, value = "-f", arg[2:]  # -fFILE
+        else:
+            return None
+
+        if name in _VALUE_OPTIONS:
+            setattr(args, _VALUE_OPTIONS[name], value)
+        else:
+            if args.files is None:
+                args.files = []
+            args.files.append(value)
+
+    return args
+
+
+def main():
+    args = fast_parse(sys.argv[1:])
+    if args is None:
+        args = build_parser().parse_args()
 
     # Handle --list-stations
     if args.list_stations:
@@ -217,6 +367,13 @@ Examples:
             console.info(f"Creating {choices_file.name}...")
             choices_file.parent.mkdir(parents=True, exist_ok=True)
             choices_file.write_text("# Remembered user choices\n\n[artist_title_fixes]\n\n[long_playing_times]\n")
+        if sys.platform != "win32":
+            # Hand the process over to the editor; nothing runs after it
+            sys.stdout.flush()
+            try:
+                os.execvp("nvim", ["nvim", str(choices_file)])
+            except OSError:
+                pass  # Fall through and let subprocess report the error
         subprocess.run(["nvim", str(choices_file)])
         sys.exit(0)
 
@@ -233,14 +390,20 @@ Examples:
             console.error(f"Rejection folder does not exist: {REJECTDIR}")
         sys.exit(0)
 
+    from processor import get_files, make_additional_filename, process_files, read_files
+    from stations import get_station
+
+    # Resolved once and passed down instead of calling getcwd() per helper
+    cwd = Path.cwd()
+
     # Determine station: use argument, or auto-detect from path
     station_name = args.station
     if not station_name:
-        station_name = detect_station_from_path()
+        station_name = detect_station_from_path(cwd)
         if station_name:
             console.info(f"Auto-detected station: {console.cyan(station_name)}")
         else:
-            parser.print_help()
+            build_parser().print_help()
             print()
             print_stations_and_aliases()
             sys.exit(1)
@@ -258,10 +421,10 @@ Examples:
 
     # Run conversion script if station requires it
     if station.convert:
-        run_convert_script()
+        run_convert_script(cwd)
 
     # Ask for output filename with suggestion
-    suggested = suggest_output_filename()
+    suggested = suggest_output_filename(cwd)
     if suggested:
         output_filename = input(f"Set output filename [{suggested}]: ").strip()
         if not output_filename:
@@ -272,7 +435,7 @@ Examples:
             console.error("Output filename cannot be empty!")
             sys.exit(1)
 
-    output_path = Path.cwd() / output_filename
+    output_path = cwd / output_filename
 
     # Check if output file is accessible (not locked by another process)
     if not ensure_file_accessible(output_path):
@@ -314,13 +477,13 @@ Examples:
         print()
     else:
         # Auto-discover files
-        files = get_files(station, exclude_filename=output_filename)
+        files = get_files(station, exclude_filename=output_filename, cwd=cwd)
     stats.files_total = len(files)
 
-    content, reject_indices = read_files(files, station, stats)
+    lines, reject_indices = read_files(files, station, stats)
 
     process_files(
-        content=content,
+        lines=lines,
         station=station,
         output_file=output_path,
         additional_filter=args.additional,
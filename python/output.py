@@ -4,6 +4,8 @@ import os
 import sys
 import time
 from dataclasses import dataclass, field
+from functools import cache
+from typing import Callable, Final
 
 # ANSI color codes
 class Colors:
@@ -29,19 +31,24 @@ class Colors:
     BRIGHT_CYAN = "\033[96m"
 
 
+@cache
 def _supports_color() -> bool:
-    """Check if the terminal supports color output."""
+    """Check if the terminal supports color output.
+
+    Cached, so the Windows console is configured at most once per process.
+    """
     # Disable colors if NO_COLOR env var is set
     if os.environ.get("NO_COLOR"):
         return False
-    # Check if stdout is a terminal
-    if not hasattr(sys.stdout, "isatty") or not sys.stdout.isatty():
+    # Check if stdout is a terminal (None under pythonw); the Windows console
+    # calls below only run for a real terminal
+    if sys.stdout is None or not sys.stdout.isatty():
         return False
     # Enable virtual terminal processing on Windows
     if sys.platform == "win32":
         try:
             import ctypes
-            kernel32 = ctypes.windll.kernel32
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
             # Enable ANSI escape code processing
             kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
         except Exception:
@@ -49,38 +56,38 @@ def _supports_color() -> bool:
     return True
 
 
-# Check color support once at module load
-USE_COLORS = _supports_color()
+# Check color support once at module load; never changes afterwards
+USE_COLORS: Final[bool] = _supports_color()
 
 
-def _color(text: str, color: str) -> str:
-    """Apply color to text if colors are supported."""
-    if USE_COLORS:
-        return f"{color}{text}{Colors.RESET}"
+def _plain(text: str) -> str:
     return text
 
 
-# Convenience functions for colored output
-def red(text: str) -> str:
-    return _color(text, Colors.BRIGHT_RED)
-
-def green(text: str) -> str:
-    return _color(text, Colors.BRIGHT_GREEN)
+def _colorizer(color: str) -> Callable[[str], str]:
+    """Build a function that wraps text in `color`.
 
-def yellow(text: str) -> str:
-    return _color(text, Colors.BRIGHT_YELLOW)
+    Resolved once at import: with colors off every helper is the identity,
+    so calls skip both the USE_COLORS check and string formatting.
+    """
+    if not USE_COLORS:
+        return _plain
+    reset = Colors.RESET
 
-def blue(text: str) -> str:
-    return _color(text, Colors.BRIGHT_BLUE)
+    def apply(text: str) -> str:
+        return color + text + reset
 
-def cyan(text: str) -> str:
-    return _color(text, Colors.BRIGHT_CYAN)
+    return apply
 
-def bold(text: str) -> str:
-    return _color(text, Colors.BOLD)
 
-def dim(text: str) -> str:
-    return _color(text, Colors.DIM)
+# Convenience functions for colored output
+red = _colorizer(Colors.BRIGHT_RED)
+green = _colorizer(Colors.BRIGHT_GREEN)
+yellow = _colorizer(Colors.BRIGHT_YELLOW)
+blue = _colorizer(Colors.BRIGHT_BLUE)
+cyan = _colorizer(Colors.BRIGHT_CYAN)
+bold = _colorizer(Colors.BOLD)
+dim = _colorizer(Colors.DIM)
 
 
 # Output functions
@@ -130,6 +137,10 @@ def format_number(n: int) -> str:
     return f"{n:,}"
 
 
+# Width of the summary box between its borders
+SUMMARY_BOX_INNER = 33
+
+
 @dataclass
 class ProcessingStats:
     """Track processing statistics."""
@@ -158,25 +169,18 @@ def print_summary_box(stats: ProcessingStats):
         tl, tr, bl, br = "+", "+", "+", "+"
         h, v, m = "-", "|", "+"
 
-    width = 35
-    inner = width - 2
-
-    def pad(text: str, raw_len: int = None) -> str:
-        """Pad text to fill the box width."""
-        if raw_len is None:
-            raw_len = len(text)
-        padding = inner - raw_len
-        return text + " " * padding
+    inner = SUMMARY_BOX_INNER
 
-    print()
-    print(f"{tl}{h * inner}{tr}")
+    # Built up and written in one call rather than a print() per line
+    out = ["", f"{tl}{h * inner}{tr}"]
 
     # Title
     title = "Processing Complete"
-    title_colored = green(title) if USE_COLORS else title
-    print(f"{v} {pad(title_colored, len(title))} {v}")
+    title_colored = green(title)
+    # Colored text is padded by its visible length
+    out.append(f"{v} {title_colored}{' ' * (inner - len(title))} {v}")
 
-    print(f"{m}{h * inner}{m}")
+    out.append(f"{m}{h * inner}{m}")
 
     # Stats
     lines = [
@@ -188,17 +192,21 @@ def print_summary_box(stats: ProcessingStats):
 
     for label, value in lines:
         line = f"{label:18} {value}"
-        print(f"{v} {pad(line)} {v}")
+        out.append(f"{v} {line:<{inner}} {v}")
 
-    print(f"{m}{h * inner}{m}")
+    out.append(f"{m}{h * inner}{m}")
 
     # Output file
     output_label = "Output:"
-    output_colored = cyan(stats.output_file) if USE_COLORS else stats.output_file
-    print(f"{v} {output_label:8} {pad(output_colored, len(stats.output_file) + 9)} {v}")
+    output_colored = cyan(stats.output_file)
+    output_padding = " " * (inner - 9 - len(stats.output_file))
+    out.append(f"{v} {output_label:8} {output_colored}{output_padding} {v}")
 
     if stats.additional_file:
-        add_colored = cyan(stats.additional_file) if USE_COLORS else stats.additional_file
-        print(f"{v} {'Extra:':8} {pad(add_colored, len(stats.additional_file) + 9)} {v}")
+        add_colored = cyan(stats.additional_file)
+        add_padding = " " * (inner - 9 - len(stats.additional_file))
+        out.append(f"{v} {'Extra:':8} {add_colored}{add_padding} {v}")
 
-    print(f"{bl}{h * inner}{br}")
+    out.append(f"{bl}{h * inner}{br}")
+    out.append("")
+    sys.stdout.write("\n".join(out))
@@ -2,37 +2,183 @@
 
 from __future__ import annotations
 
+import codecs
+import hashlib
 import json
+import os
 import re
-import subprocess
 import sys
+import time
 from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
-from typing import IO, TYPE_CHECKING
+from typing import IO, TYPE_CHECKING, Iterable
 
-import chardet
+from charset_normalizer import from_bytes
+
+try:
+    # orjson serializes in C and returns bytes; the file stays plain JSON
+    import orjson
+
+    def _dump_json(data: dict) -> bytes:
+        return orjson.dumps(data, default=str)
+
+    _load_json = orjson.loads
+except ImportError:
+
+    def _dump_json(data: dict) -> bytes:
+        return json.dumps(data, separators=(",", ":"), default=str).encode("utf-8")
+
+    _load_json = json.loads
 
 import app_logging as logging
 import output as console
 from choices import get_choices_manager
-from config import ADDITIONAL_POSTFIX, DELETE_COLS_SCRIPT, REJECTDIR
+from config import ADDITIONAL_POSTFIX, CACHE_DIR, DELETE_COLS_SCRIPT, REJECTDIR
 from decisions import DecisionManager, ARTIST_TITLE_CONFIG, LONG_TIME_CONFIG, DUPLICATE_CONFIG, DecisionConfig, Option
-from formatters import format_date, format_time, format_duration, get_duration_minutes
+from formatters import format_date, format_time, get_duration_minutes, get_formatter
 from settings import get_settings
 from stations import Station
 
 if TYPE_CHECKING:
+    from formatters import FieldFormatter
     from output import ProcessingStats
 
 
 # Checkpoint file for error recovery
 CHECKPOINT_FILE = ".komm_fmt_checkpoint.json"
+# Minimum seconds between checkpoint writes while processing lines
+CHECKPOINT_INTERVAL = 5.0
+
+# Encoding detection examines at most this many bytes, read in blocks
+ENCODING_SAMPLE_SIZE = 256 * 1024
+ENCODING_BLOCK_SIZE = 64 * 1024
+# Station files are utf-8 or Windows-1252; unrestricted detection tends to
+# pick cp1250 for Danish text
+CANDIDATE_ENCODINGS = ["utf_8", "cp1252"]
+# Encodings identified by a byte order mark, checked before detection.
+# UTF-32 first: its little-endian mark starts with the UTF-16 one.
+BOM_ENCODINGS = [
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+# Input files read ahead in parallel by read_files
+READ_WORKERS = 8
+
+# clean_empty_file reads at most this much at a time while counting lines
+CLEAN_CHECK_BLOCK_SIZE = 64 * 1024
+
+# Buffer size for the output, reject and additional files
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Distinct formatted lines remembered by process_files
+LINE_CACHE_MAX_ENTRIES = 100_000
+
+# Detected encodings from earlier runs: absolute path -> [fingerprint, encoding]
+ENCODING_CACHE_FILE = CACHE_DIR / "encodings.json"
+ENCODING_CACHE_MAX_ENTRIES = 1000
+_encoding_cache: dict[str, list[str]] | None = None
+_encoding_cache_dirty = False
+
+
+def _detect_encoding_uncached(file_path: Path) -> str:
+    """Detect file encoding using charset-normalizer on a bounded sample.
+
+    A byte order mark decides the encoding outright (UTF-8, UTF-16, UTF-32).
+    Otherwise leading pure-ASCII blocks are skipped without running detection,
+    since they cannot tell encodings apart; at most ENCODING_SAMPLE_SIZE bytes
+    from the first non-ASCII block onwards are examined.
+
+    Args:
+        file_path: Path to the file to detect encoding for.
+
+    Returns:
+        Detected encoding string, defaulting to utf-8 if detection fails.
+    """
+    sample = bytearray()
+    with open(file_path, "rb") as f:
+        head = f.read(4)
+        for bom, encoding in BOM_ENCODINGS:
+            if head.startswith(bom):
+                return encoding
+        f.seek(0)
+        while len(sample) < ENCODING_SAMPLE_SIZE:
+            block = f.read(ENCODING_BLOCK_SIZE)
+            if not block:
+                break
+            if not sample and block.isascii():
+                continue
+            sample += block
+
+    if not sample:
+        # Pure ASCII; cp1252 is a superset and also reads stray 8-bit bytes
+        return "cp1252"
+
+    # Cut a truncated sample at the last full line so a split multi-byte
+    # character does not skew detection
+    if len(sample) >= ENCODING_SAMPLE_SIZE:
+        last_newline = sample.rfind(b"\n")
+        if last_newline > 0:
+            del sample[last_newline + 1:]
+
+    best = from_bytes(bytes(sample), cp_isolation=CANDIDATE_ENCODINGS).best()
+    if best is None:
+        return "utf-8"
+    return "utf-8" if best.encoding == "utf_8" else "cp1252"
+
+def _load_encoding_cache() -> dict[str, list[str]]:
+    """Load the encoding cache, or an empty one if missing or unreadable."""
+    global _encoding_cache
+    if _encoding_cache is None:
+        try:
+            with open(ENCODING_CACHE_FILE, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            data = None
+        # Drop anything a hand edit or another version could have left behind
+        _encoding_cache = {}
+        if isinstance(data, dict):
+            for path_key, entry in data.items():
+                if (isinstance(entry, list) and len(entry) == 2
+                        and all(isinstance(item, str) for item in entry)):
+                    _encoding_cache[path_key] = entry
+    return _encoding_cache
+
+
+def save_encoding_cache() -> None:
+    """Write detected encodings back to the cache file if any were added."""
+    global _encoding_cache_dirty
+    if not _encoding_cache_dirty:
+        return
+
+    cache = _load_encoding_cache()
+    # Keep the most recently added entries
+    if len(cache) > ENCODING_CACHE_MAX_ENTRIES:
+        for path in list(cache)[: len(cache) - ENCODING_CACHE_MAX_ENTRIES]:
+            del cache[path]
+
+    try:
+        ENCODING_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = ENCODING_CACHE_FILE.with_name(f"{ENCODING_CACHE_FILE.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, ENCODING_CACHE_FILE)
+        _encoding_cache_dirty = False
+    except OSError as e:
+        logging.log_error(f"Failed to save encoding cache: {e}")
 
 
 def detect_encoding(file_path: Path) -> str:
-    """Detect file encoding using chardet.
+    """Detect file encoding, reusing the result from an earlier run if possible.
+
+    Results are cached per absolute path with a fingerprint of size, mtime
+    and a hash of the first 4 KiB, so a changed file is detected again.
 
     Args:
         file_path: Path to the file to detect encoding for.
@@ -40,23 +186,34 @@ def detect_encoding(file_path: Path) -> str:
     Returns:
         Detected encoding string, defaulting to utf-8 if detection fails.
     """
+    global _encoding_cache_dirty
+    st = file_path.stat()
     with open(file_path, "rb") as f:
-        raw_data = f.read()
-    result = chardet.detect(raw_data)
-    encoding = result.get("encoding", "utf-8")
-    # Handle common encoding aliases
-    if encoding and encoding.lower() in ("ascii", "iso-8859-1", "latin-1", "latin1"):
-        # These are often misdetected; try cp1252 which is a superset
-        encoding = "cp1252"
-    return encoding or "utf-8"
+        head = f.read(4096)
+    fingerprint = f"{st.st_size}:{st.st_mtime_ns}:{hashlib.blake2b(head, digest_size=8).hexdigest()}"
+
+    cache = _load_encoding_cache()
+    path_key = str(file_path.resolve())
+    cached = cache.get(path_key)
+    if cached and cached[0] == fingerprint:
+        return cached[1]
 
+    encoding = _detect_encoding_uncached(file_path)
+    cache.pop(path_key, None)  # Re-insert so it counts as most recent
+    cache[path_key] = [fingerprint, encoding]
+    _encoding_cache_dirty = True
+    return encoding
 
-def get_files(station: Station, exclude_filename: str = "") -> list[Path]:
+
+def get_files(
+    station: Station, exclude_filename: str = "", cwd: Path | None = None
+) -> list[Path]:
     """Find files in current directory matching station's extensions.
 
     Args:
         station: Station configuration with file extensions.
         exclude_filename: Filename to exclude from results.
+        cwd: Directory to search. If None, uses the current directory.
 
     Returns:
         List of matching file paths.
@@ -64,16 +221,16 @@ def get_files(station: Station, exclude_filename: str = "") -> list[Path]:
     Raises:
         SystemExit: If no eligible files are found.
     """
-    cwd = Path.cwd()
+    if cwd is None:
+        cwd = Path.cwd()
     files: list[Path] = []
 
-    # Pre-lowercase extensions for efficient comparison
-    extensions_lower = [ext.lower() for ext in station.ext]
-
-    for f in cwd.iterdir():
-        if f.is_file() and f.name != exclude_filename:
-            name_lower = f.name.lower()
-            if any(ext in name_lower for ext in extensions_lower):
+    # Extensions match anywhere in the name (e.g. "x.txt.bak"), so one
+    # case-insensitive alternation replaces a substring test per extension
+    if station.ext:
+        ext_pattern = re.compile("|".join(map(re.escape, station.ext)), re.IGNORECASE)
+        for f in cwd.iterdir():
+            if f.name != exclude_filename and ext_pattern.search(f.name) and f.is_file():
                 files.append(f)
 
     if not files:
@@ -103,8 +260,8 @@ def save_checkpoint(
 
     checkpoint_path = output_dir / CHECKPOINT_FILE
     try:
-        with open(checkpoint_path, "w", encoding="utf-8") as f:
-            json.dump(checkpoint_data, f, indent=2, default=str)
+        with open(checkpoint_path, "wb") as f:
+            f.write(_dump_json(checkpoint_data))
     except Exception as e:
         logging.log_error(f"Failed to save checkpoint: {e}")
 
@@ -126,8 +283,8 @@ def load_checkpoint(output_dir: Path | None = None) -> dict | None:
         return None
 
     try:
-        with open(checkpoint_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(checkpoint_path, "rb") as f:
+            return _load_json(f.read())
     except Exception:
         return None
 
@@ -167,15 +324,18 @@ def check_artist_title_split(
 
     choices_manager = get_choices_manager()
 
-    # Find issues, skipping lines that match stopwords
+    # Find issues, skipping lines that match stopwords. Splitting stops past
+    # the last field read, so the tail of each line stays one string.
     issues: dict[tuple[str, str], list[int]] = {}
+    sep = station.separator
+    max_idx = max(title_idx, artist_idx)
     for i, line in enumerate(lines):
-        if not line.strip():
+        if not line or line.isspace():
             continue
         if station.matches_stopword_lower(line.lower()):
             continue
-        fields = line.split(station.separator)
-        if len(fields) > max(title_idx, artist_idx) and " - " in fields[title_idx]:
+        fields = line.split(sep, max_idx + 1)
+        if len(fields) > max_idx and " - " in fields[title_idx]:
             key = (fields[title_idx], fields[artist_idx])
             if key not in issues:
                 issues[key] = []
@@ -226,6 +386,8 @@ def check_artist_title_split(
         apply_action=apply_action,
         summary_message=f"Found {len(issues)} unique artist/title split issue(s)",
     )
+    # Save this batch of answers now rather than only at exit
+    choices_manager.flush()
 
     # Apply fixes to lines
     for i in lines_to_fix:
@@ -238,20 +400,41 @@ def check_artist_title_split(
     return modified_lines, reject_indices
 
 
-def read_single_file(file_path: Path, station: Station) -> list[str]:
+def _load_file(file_path: Path) -> tuple[str, str]:
+    """Detect a file's encoding and decode it.
+
+    Touches no console or station state, so read_files can run it on a
+    worker thread.
+
+    Args:
+        file_path: Path to file to read.
+
+    Returns:
+        Tuple of (encoding, decoded content).
+    """
+    encoding = detect_encoding(file_path)
+    return encoding, file_path.read_text(encoding=encoding, errors="replace")
+
+
+def read_single_file(
+    file_path: Path,
+    station: Station,
+    loaded: Future[tuple[str, str]] | None = None,
+) -> list[str]:
     """Read a single file and apply initial transformations.
 
     Args:
         file_path: Path to file to read.
         station: Station configuration.
+        loaded: Pending result of _load_file for this file, if it is already
+                being read in the background.
 
     Returns:
         List of processed lines, or empty list on error.
     """
     try:
-        encoding = detect_encoding(file_path)
+        encoding, content = loaded.result() if loaded else _load_file(file_path)
         console.info(console.dim(f"    Encoding: {encoding}"))
-        content = file_path.read_text(encoding=encoding, errors="replace")
     except Exception as e:
         console.error(f"Could not read file {file_path}: {e}")
         logging.log_error(f"Could not read file {file_path}", e)
@@ -260,9 +443,9 @@ def read_single_file(file_path: Path, station: Station) -> list[str]:
     lines = content.splitlines()
     logging.log_file_read(file_path, encoding, len(lines))
 
-    # Skip header lines
+    # Skip header lines in place rather than copying the rest of the list
     if station.skip_lines > 0 and lines:
-        lines = lines[station.skip_lines:]
+        del lines[:station.skip_lines]
 
     # Apply configured transformations
     if station.transformations:
@@ -275,7 +458,7 @@ def read_files(
     files: list[Path],
     station: Station,
     stats: ProcessingStats | None = None,
-) -> tuple[str, set[int]]:
+) -> tuple[list[str], set[int]]:
     """Read and concatenate all input files, applying transformations and validation.
 
     Args:
@@ -284,30 +467,48 @@ def read_files(
         stats: Optional stats object to update.
 
     Returns:
-        Tuple of (concatenated content string, set of line indices to reject).
+        Tuple of (concatenated lines, set of line indices to reject). The
+        lines are handed to process_files as-is, without a join/split round trip.
     """
     joined_content: list[str] = []
     all_reject_indices: set[int] = set()
     total_files = len(files)
 
-    # Phase 1: Read and transform files
-    for idx, file_path in enumerate(files, 1):
-        console.progress(idx, total_files, f"Reading {file_path.name}")
-        if stats:
-            stats.files_processed = idx
+    # Detection and decoding are independent per file, so later files are
+    # read on worker threads while earlier ones are checked. Anything that
+    # prints or prompts stays here, in file order.
+    _load_encoding_cache()  # Load before the workers share it
+    with ExitStack() as stack:
+        loads: list[Future[tuple[str, str]] | None] = [None] * total_files
+        if total_files > 1:
+            pool = stack.enter_context(
+                ThreadPoolExecutor(max_workers=min(READ_WORKERS, total_files))
+            )
+            loads = [pool.submit(_load_file, file_path) for file_path in files]
 
-        lines = read_single_file(file_path, station)
-        if not lines:
-            continue
+        # Phase 1: Read and transform files
+        for idx, (file_path, loaded) in enumerate(zip(files, loads), 1):
+            console.progress(idx, total_files, f"Reading {file_path.name}")
+            if stats:
+                stats.files_processed = idx
+
+            lines = read_single_file(file_path, station, loaded)
+            if not lines:
+                continue
 
-        # Phase 2: Check artist/title split (if configured)
-        if station.fix_artist_title_split:
-            lines, reject_indices = check_artist_title_split(lines, station)
-            # Offset indices to global position
-            offset = len(joined_content)
-            all_reject_indices.update(i + offset for i in reject_indices)
+            # Phase 2: Check artist/title split (if configured)
+            if station.fix_artist_title_split:
+                lines, reject_indices = check_artist_title_split(lines, station)
+                # Offset indices to global position; usually there are none
+                if reject_indices:
+                    offset = len(joined_content)
+                    all_reject_indices.update(
+                        reject_indices if not offset else {i + offset for i in reject_indices}
+                    )
 
-        joined_content.extend(lines)
+            joined_content.extend(lines)
+
+    save_encoding_cache()
 
     # Phase 3: Check for multiple years
     joined_content = check_multiple_years(joined_content, station)
@@ -322,9 +523,10 @@ def read_files(
             joined_content, time_reject_indices = check_long_playing_times(
                 joined_content, station, title_idx, artist_idx, time_idx
             )
-            all_reject_indices.update(time_reject_indices)
+            if time_reject_indices:
+                all_reject_indices |= time_reject_indices
 
-    return "\n".join(joined_content), all_reject_indices
+    return joined_content, all_reject_indices
 
 
 def make_additional_filename(base_path: Path) -> Path:
@@ -382,17 +584,34 @@ def check_long_playing_times(
     # Find lines with long playing times, grouped by unique track
     issues: dict[tuple[str, str, str], list[int]] = {}
     sep = station.separator
+    max_idx = max(title_idx, artist_idx, time_idx)
+    formatter = get_formatter()
+    skip_below = min(threshold, formatter.overflow_threshold)
 
     for i, line in enumerate(lines):
-        if not line.strip():
+        if not line or line.isspace():
             continue
 
-        fields = line.split(sep)
-        if len(fields) <= max(title_idx, artist_idx, time_idx):
+        # Only fields up to max_idx are read; leave the rest unsplit
+        fields = line.split(sep, max_idx + 1)
+        if len(fields) <= max_idx:
+            continue
+
+        # Cheap pre-check on the raw minutes: the overflow fix only lowers
+        # them, so anything below both thresholds can neither be long nor be
+        # rewritten (and logged) by format_duration
+        raw_time = fields[time_idx]
+        colon = raw_time.find(":")
+        if colon < 0:
+            continue
+        try:
+            if int(raw_time[:colon]) < skip_below:
+                continue
+        except ValueError:
             continue
 
         # Get playing time and apply overflow fix first
-        playing_time = format_duration(fields[time_idx])
+        playing_time = formatter.format_duration(raw_time)
         minutes = get_duration_minutes(playing_time)
 
         if minutes is not None and minutes >= threshold:
@@ -409,7 +628,6 @@ def check_long_playing_times(
 
     # Track edits to apply
     edits_to_apply: dict[int, str] = {}
-    modified_lines = lines.copy()
 
     def display_issue(key: tuple, indices: list[int], count: int) -> None:
         title, artist, playing_time = key
@@ -477,8 +695,14 @@ def check_long_playing_times(
         summary_message=f"Found {len(issues)} unique track(s) with playing time over {threshold} minutes",
         extra_input_handler=handle_edit_input,
     )
+    # Save this batch of answers now rather than only at exit
+    choices_manager.flush()
+
+    if not edits_to_apply:
+        return lines, reject_indices
 
-    # Apply edits to lines
+    # Apply edits to a copy, made only when something was edited
+    modified_lines = lines.copy()
     for idx, new_time in edits_to_apply.items():
         fields = modified_lines[idx].split(sep)
         if len(fields) > time_idx:
@@ -511,36 +735,44 @@ def check_duplicates(
     if not settings.duplicates.enabled:
         return lines, set()
 
-    # Track seen combinations: (title, artist, date) -> first line index
-    seen: dict[tuple[str, str, str], int] = {}
-    duplicates: dict[tuple[str, str, str], list[int]] = {}
+    # Line indices per (title, artist, date); the first one is the original
+    groups: dict[tuple[str, str, str], list[int]] = {}
+    # Keys in the order their first duplicate was seen, which is prompt order
+    duplicate_keys: list[tuple[str, str, str]] = []
     sep = station.separator
+    max_idx = max(title_idx, artist_idx, date_idx)
 
     for i, line in enumerate(lines):
-        if not line.strip():
+        if not line or line.isspace():
             continue
 
-        fields = line.split(sep)
-        if len(fields) <= max(title_idx, artist_idx, date_idx):
+        # Only split as far as the key fields
+        fields = line.split(sep, max_idx + 1)
+        if len(fields) <= max_idx:
             continue
 
-        title = fields[title_idx].strip().lower() if len(fields) > title_idx else ""
-        artist = fields[artist_idx].strip().lower() if len(fields) > artist_idx else ""
-        date = fields[date_idx].strip() if len(fields) > date_idx else ""
+        # All key fields exist past the length check above. Interned, so
+        # repeated artists/titles share one string and compare by identity
+        title = sys.intern(fields[title_idx].strip().lower())
+        artist = sys.intern(fields[artist_idx].strip().lower())
+        date = sys.intern(fields[date_idx].strip())
 
         key = (title, artist, date)
 
-        if key in seen:
-            if key not in duplicates:
-                duplicates[key] = [seen[key]]
-            duplicates[key].append(i)
-            logging.log_duplicate_found(i, title, artist, date, seen[key])
+        group = groups.get(key)
+        if group is None:
+            groups[key] = [i]
         else:
-            seen[key] = i
+            if len(group) == 1:
+                duplicate_keys.append(key)
+            group.append(i)
+            logging.log_duplicate_found(i, title, artist, date, group[0])
 
-    if not duplicates:
+    if not duplicate_keys:
         return lines, set()
 
+    duplicates = {key: groups[key] for key in duplicate_keys}
+
     total_dups = sum(len(indices) - 1 for indices in duplicates.values())
     action = settings.duplicates.action
 
@@ -630,10 +862,11 @@ def check_multiple_years(
     lines_by_year: dict[str, list[int]] = {}
 
     for i, line in enumerate(lines):
-        if not line.strip():
+        if not line or line.isspace():
             continue
 
-        fields = line.split(sep)
+        # Only the date field is needed
+        fields = line.split(sep, date_idx + 1)
         if len(fields) <= date_idx:
             continue
 
@@ -686,8 +919,7 @@ def check_multiple_years(
         action = config.parse_response(response)
 
         if action is None:
-            valid_keys = ", ".join(o.key.upper() for o in options)
-            console.error(f"  Invalid choice. Enter one of: {valid_keys}")
+            console.error(f"  Invalid choice. Enter one of: {config.keys_hint}")
             continue
         break
 
@@ -707,27 +939,19 @@ def check_multiple_years(
 
 
 def process_positional_line(
-    line: str, sorted_positions: list[int], separator: str
+    line: str, position_slices: list[slice], separator: str
 ) -> str:
-    """Extract fields from a fixed-width line using pre-sorted positional indices.
+    """Extract fields from a fixed-width line using pre-built field slices.
 
     Args:
         line: Input line to process.
-        sorted_positions: List of column boundary positions.
+        position_slices: One slice per field, from Station.position_slices.
         separator: Output field separator.
 
     Returns:
         Processed line with fields separated.
     """
-    parts: list[str] = []
-    start = 0
-
-    for pos in sorted_positions:
-        effective_pos = min(pos, len(line))
-        if effective_pos >= start:
-            part = line[start:effective_pos].strip()
-            parts.append(part)
-            start = effective_pos
+    parts = [line[field_slice].strip() for field_slice in position_slices]
 
     # Format first field (date) if present
     if parts:
@@ -736,18 +960,26 @@ def process_positional_line(
     return separator.join(parts)
 
 
-def process_csv_line(line: str, separator: str = ";", input_separator: str = ";") -> str:
+def process_csv_line(
+    line: str,
+    separator: str = ";",
+    input_separator: str = ";",
+    formatter: FieldFormatter | None = None,
+) -> str:
     """Process a CSV-delimited line, formatting date and time fields.
 
     Args:
         line: Input line to process.
         separator: Output field separator.
         input_separator: Input field separator for parsing.
+        formatter: Formatter for the playing time. Defaults to the global
+                   one; callers in a loop pass it in to skip the lookup.
 
     Returns:
         Processed line with formatted fields.
     """
-    fields = line.split(input_separator)
+    # Only the first three fields are formatted; the rest stays one string
+    fields = line.split(input_separator, 3)
 
     # Format date field (index 0)
     if fields:
@@ -759,7 +991,10 @@ def process_csv_line(line: str, separator: str = ";", input_separator: str = ";"
 
     # Fix overflow playing time (index 2)
     if len(fields) > 2:
-        fields[2] = format_duration(fields[2])
+        fields[2] = (formatter or get_formatter()).format_duration(fields[2])
+
+    if len(fields) > 3 and separator != input_separator:
+        fields[3] = fields[3].replace(input_separator, separator)
 
     return separator.join(fields)
 
@@ -782,8 +1017,12 @@ def clean_empty_file(file_path: Path) -> None:
         file_path: Path to file to check and potentially remove.
     """
     if file_path.exists():
-        content = file_path.read_text(encoding="utf-8", errors="replace")
-        line_count = content.count("\n")
+        # Only whether there is more than one newline matters, so stop reading
+        # once a second one is seen instead of loading the whole file
+        line_count = 0
+        with open(file_path, "rb") as f:
+            while line_count <= 1 and (chunk := f.read(CLEAN_CHECK_BLOCK_SIZE)):
+                line_count += chunk.count(b"\n")
         if line_count <= 1:
             file_path.unlink()
             console.info(console.dim(f"Removed empty file: {file_path.name}"))
@@ -792,39 +1031,44 @@ def clean_empty_file(file_path: Path) -> None:
 def run_delete_columns(output_path: Path) -> None:
     """Run the delete_columns.py script on the output file.
 
+    The script's main() runs in this interpreter via run_python_script,
+    skipping the start-up of a new one.
+
     Args:
         output_path: Path to the output file to process.
     """
+    # Imported here: lib/ ships next to the modules but is not a package, so
+    # a missing lib directory only skips the cleanup, as a missing script did
     try:
-        subprocess.run(
-            [sys.executable, str(DELETE_COLS_SCRIPT), str(output_path)],
-            check=True,
-        )
-    except subprocess.CalledProcessError as e:
-        console.warning(f"delete_columns.py failed: {e}")
-        logging.log_error(f"delete_columns.py failed", e)
-    except FileNotFoundError:
+        from lib.utils import run_python_script
+    except ImportError:
         console.warning(f"Could not find {DELETE_COLS_SCRIPT}")
+        return
+
+    if not run_python_script(DELETE_COLS_SCRIPT, str(output_path)):
+        console.warning(f"delete_columns.py failed on {output_path.name}")
+        logging.log_error(f"delete_columns.py failed on {output_path}")
 
 
-def process_line(line: str, station: Station) -> str:
+def process_line(line: str, station: Station, formatter: FieldFormatter | None = None) -> str:
     """Process a single line according to station format.
 
     Args:
         line: Input line to process.
         station: Station configuration.
+        formatter: Optional formatter passed on to process_csv_line.
 
     Returns:
         Processed line string.
     """
     if station.positional:
-        return process_positional_line(line, station.sorted_positions, station.separator)
+        return process_positional_line(line, station.position_slices, station.separator)
     else:
-        return process_csv_line(line, station.separator, station.input_separator)
+        return process_csv_line(line, station.separator, station.input_separator, formatter)
 
 
 def process_files(
-    content: str,
+    lines: Iterable[str],
     station: Station,
     output_file: Path,
     additional_filter: str = "",
@@ -836,7 +1080,7 @@ def process_files(
     """Main processing pipeline for station data.
 
     Args:
-        content: Concatenated content to process.
+        lines: Lines to process, as returned by read_files.
         station: Station configuration.
         output_file: Path for main output file.
         additional_filter: Optional filter for routing to additional file.
@@ -855,6 +1099,9 @@ def process_files(
     additional_path = make_additional_filename(output_file) if has_additional else None
     reject_path = generate_rejection_filename(station) if save_reject_file else None
 
+    # Looked up once here rather than for every line
+    formatter = get_formatter()
+
     # Pre-lowercase additional filter for fast comparison
     additional_filter_lower = additional_filter.lower() if has_additional else ""
 
@@ -876,16 +1123,20 @@ def process_files(
     try:
         # Open all output files using ExitStack for proper context management
         with ExitStack() as stack:
-            out_f = stack.enter_context(open(output_file, "w", encoding="utf-8"))
+            out_f = stack.enter_context(
+                open(output_file, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+            )
 
             reject_f: IO[str] | None = None
             if reject_path:
-                reject_f = stack.enter_context(open(reject_path, "w", encoding="utf-8"))
+                reject_f = stack.enter_context(
+                    open(reject_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+                )
 
             additional_f: IO[str] | None = None
             if has_additional:
                 additional_f = stack.enter_context(
-                    open(additional_path, "w", encoding="utf-8")
+                    open(additional_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
                 )
                 console.info(f"Additional filter: {console.cyan(additional_filter)}")
                 if stats:
@@ -896,62 +1147,118 @@ def process_files(
             write_headlines(out_f, station)
             if reject_f:
                 write_headlines(reject_f, station)
+            # Byte size of a header-only file, to spot empty results by size
+            header_size = out_f.tell()
+
+            # Output is collected per file and written in batches, one
+            # write per file every 1000 lines rather than one per line
+            out_buf: list[str] = []
+            reject_buf: list[str] = []
+            additional_buf: list[str] = []
+
+            def flush_buffers() -> None:
+                for f, buf in (
+                    (out_f, out_buf),
+                    (reject_f, reject_buf),
+                    (additional_f, additional_buf),
+                ):
+                    if buf:
+                        f.write("\n".join(buf))
+                        f.write("\n")
+                        buf.clear()
+
+            # Station dumps repeat whole lines (jingles, stingers, reruns), so
+            # each distinct line is formatted once; bounded to cap memory
+            line_cache: dict[str, str] = {}
+
+            def format_line(line: str) -> str:
+                output_line = line_cache.get(line)
+                if output_line is None:
+                    output_line = process_line(line, station, formatter)
+                    if len(line_cache) < LINE_CACHE_MAX_ENTRIES:
+                        line_cache[line] = output_line
+                return output_line
+
+            # Bound once: names in the loop are plain locals, not attribute
+            # lookups, globals or the closure cells used by flush_buffers
+            out_append = out_buf.append
+            reject_append = reject_buf.append
+            additional_append = additional_buf.append
+            find_stopword = station.get_matched_stopword
+            log_rejection = logging.log_rejection
+            log_stopword_match = logging.log_stopword_match
+
+            # Forced rejections as a byte per line, only up to the highest index
+            force_mask = bytearray(max(force_reject_indices) + 1 if force_reject_indices else 0)
+            for i in force_reject_indices or ():
+                force_mask[i] = 1
+            force_limit = len(force_mask)
+
+            # Only stopword matching and the additional filter use line_lower
+            needs_lower = use_stopwords or has_additional
 
             # Process each line
             line_index = 0
-            lines = content.splitlines()
-            total_lines = len(lines)
+            last_checkpoint = time.monotonic()
+
+            try:
+                for line in lines:
+                    # Same test as "not line.strip()" without building a copy
+                    if not line or line.isspace():
+                        line_index += 1
+                        continue
+
+                    # Check if line was marked for forced rejection
+                    if line_index < force_limit and force_mask[line_index]:
+                        if reject_f:
+                            reject_append(format_line(line))
+                        rejected += 1
+                        log_rejection(line_index, "forced_reject", line)
+                        line_index += 1
+                        continue
+
+                    # Pre-compute lowercase once for efficiency, if anything reads it
+                    line_lower = line.lower() if needs_lower else line
+
+                    # Check stopwords using pre-compiled regex; one search both
+                    # decides rejection and names the stopword for the summary
+                    matched_stopword = find_stopword(line_lower) if use_stopwords else None
+                    if matched_stopword is not None:
+                        if reject_f:
+                            reject_append(format_line(line))
+                        rejected += 1
+
+                        # Track which stopword matched for summary
+                        if matched_stopword:
+                            stopword_counts[matched_stopword] += 1
+                            log_stopword_match(line_index, matched_stopword)
+
+                        line_index += 1
+                        continue
+
+                    # Process the line
+                    output_line = format_line(line)
+                    processed += 1
+
+                    # Check for additional routing
+                    if has_additional and additional_filter_lower in line_lower:
+                        additional_append(output_line)
+                    else:
+                        out_append(output_line)
 
-            for line in lines:
-                if not line.strip():
-                    line_index += 1
-                    continue
-
-                # Check if line was marked for forced rejection
-                if force_reject_indices and line_index in force_reject_indices:
-                    if reject_f:
-                        reject_line = process_line(line, station)
-                        reject_f.write(reject_line + "\n")
-                    rejected += 1
-                    logging.log_rejection(line_index, "forced_reject", line)
                     line_index += 1
-                    continue
-
-                # Pre-compute lowercase once for efficiency
-                line_lower = line.lower()
-
-                # Check stopwords using pre-compiled regex
-                if use_stopwords and station.matches_stopword_lower(line_lower):
-                    if reject_f:
-                        reject_line = process_line(line, station)
-                        reject_f.write(reject_line + "\n")
-                    rejected += 1
-
-                    # Track which stopword matched for summary
-                    matched_stopword = station.get_matched_stopword(line_lower)
-                    if matched_stopword:
-                        stopword_counts[matched_stopword] += 1
-                        logging.log_stopword_match(line_index, matched_stopword)
-
-                    line_index += 1
-                    continue
-
-                # Process the line
-                output_line = process_line(line, station)
-                processed += 1
-
-                # Check for additional routing
-                if has_additional and additional_filter_lower in line_lower:
-                    additional_f.write(output_line + "\n")
-                else:
-                    out_f.write(output_line + "\n")
-
-                line_index += 1
 
-                # Update checkpoint periodically
-                if line_index % 1000 == 0:
-                    checkpoint_data["lines_processed"] = line_index
-                    save_checkpoint(checkpoint_data)
+                    # Flush every 1000 lines; checkpoint at most every few seconds
+                    if line_index % 1000 == 0:
+                        flush_buffers()
+                        now = time.monotonic()
+                        if now - last_checkpoint >= CHECKPOINT_INTERVAL:
+                            checkpoint_data["lines_processed"] = line_index
+                            save_checkpoint(checkpoint_data)
+                            last_checkpoint = now
+            finally:
+                # Also on failure, so the output holds every line handled so far
+                flush_buffers()
 
         # Update stats
         if stats:
@@ -983,18 +1290,18 @@ def process_files(
     if reject_path:
         clean_empty_file(reject_path)
 
-    # Check if output file is empty (only header) and run delete_columns
+    # Check if output file is empty (only header) and run delete_columns.
+    # Anything past the header is at least one data line, so the size tells
+    # without reading the file back.
     if output_file.exists():
-        output_content = output_file.read_text(encoding="utf-8", errors="replace")
-        if output_content.count("\n") > 1:
+        if output_file.stat().st_size > header_size:
             run_delete_columns(output_file)
         else:
             clean_empty_file(output_file)
 
     # Also run delete_columns on rejection file
     if reject_path and reject_path.exists():
-        reject_content = reject_path.read_text(encoding="utf-8", errors="replace")
-        if reject_content.count("\n") > 1:
+        if reject_path.stat().st_size > header_size:
             run_delete_columns(reject_path)
 
     # Print stopword summary
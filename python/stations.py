@@ -32,12 +32,17 @@ class Station:
     _stopword_pattern: Optional[re.Pattern] = field(default=None, repr=False)
     _stopwords: list[str] = field(default_factory=list, repr=False)
     _sorted_positions: list[int] = field(default_factory=list, repr=False)
+    _position_slices: list[slice] = field(default_factory=list, repr=False)
     _title_suffix_pattern: Optional[re.Pattern] = field(default=None, repr=False)
 
     def __post_init__(self):
         """Pre-sort positions and derive field mappings from headlines if needed."""
         if self.positions:
             self._sorted_positions = sorted(self.positions)
+            # One slice per field, between consecutive boundaries. Slicing
+            # clamps to the line length; negative positions never cut a field.
+            bounds = [0] + [pos for pos in self._sorted_positions if pos >= 0]
+            self._position_slices = [slice(a, b) for a, b in zip(bounds, bounds[1:])]
 
         # Auto-derive field_mappings from headlines if not explicitly set
         if not self.field_mappings and self.headlines:
@@ -69,6 +74,11 @@ class Station:
         """Return pre-sorted positions."""
         return self._sorted_positions
 
+    @property
+    def position_slices(self) -> list[slice]:
+        """Return the field slices derived from the sorted positions."""
+        return self._position_slices
+
     def matches_stopword(self, line: str) -> bool:
         """Check if line matches any stopword using compiled regex."""
         if self._stopword_pattern is None: